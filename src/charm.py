@@ -4,11 +4,14 @@
 
 """A Juju charm for Identity Platform Hook Service."""
 
+import hashlib
 import json
 import logging
+import os
 import subprocess
-from os.path import join
-from secrets import token_hex
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import Any, Callable, ClassVar
 
 import ops
 from charms.certificate_transfer_interface.v1.certificate_transfer import (
@@ -19,10 +22,8 @@ from charms.data_platform_libs.v0.data_interfaces import (
     DatabaseEndpointsChangedEvent,
     DatabaseRequires,
 )
-from charms.grafana_k8s.v0.grafana_dashboard import GrafanaDashboardProvider
 from charms.hydra.v0.hydra_token_hook import HydraHookProvider
 from charms.hydra.v0.oauth import OAuthInfoChangedEvent, OAuthInfoRemovedEvent, OAuthRequirer
-from charms.loki_k8s.v1.loki_push_api import LogForwarder
 from charms.observability_libs.v0.kubernetes_compute_resources_patch import (
     K8sResourcePatchFailedEvent,
     KubernetesComputeResourcesPatch,
@@ -34,8 +35,6 @@ from charms.openfga_k8s.v1.openfga import (
     OpenFGAStoreCreateEvent,
     OpenFGAStoreRemovedEvent,
 )
-from charms.prometheus_k8s.v0.prometheus_scrape import MetricsEndpointProvider
-from charms.tempo_coordinator_k8s.v0.tracing import TracingEndpointRequirer
 from charms.tenant_service.v0.tenant_service_info import TenantServiceInfoRequirer
 from charms.traefik_k8s.v0.traefik_route import TraefikRouteRequirer
 
@@ -53,6 +52,7 @@ from constants import (
     LOCAL_CHARM_CERTIFICATES_FILE,
     LOCAL_CHARM_CERTIFICATES_PATH,
     LOGGING_INTEGRATION_NAME,
+    MIGRATION_OK_FINGERPRINT,
     OAUTH_INTEGRATION_NAME,
     OPENFGA_INTEGRATION_NAME,
     OPENFGA_MODEL_ID,
@@ -77,6 +77,7 @@ from integrations import (
     InternalIngressData,
     OAuthIntegration,
     OpenFGAIntegration,
+    OpenFGAIntegrationData,
     OpenFGAModelData,
     PeerData,
     TenantServiceInfoData,
@@ -87,6 +88,7 @@ from secret import Secrets
 from services import PebbleService, WorkloadService
 from utils import (
     NOOP_CONDITIONS,
+    Condition,
     authentication_config_status,
     container_connectivity,
     database_integration_exists,
@@ -98,31 +100,128 @@ from utils import (
 
 logger = logging.getLogger(__name__)
 
+# Static scrape configuration, hoisted so it is allocated once per process
+# instead of on every charm instantiation. The provider copies it on use.
+_DEFAULT_RESOURCE_REQUESTS = {"cpu": "100m", "memory": "200Mi"}
+
+# Hooks that only log; the observability providers are never consulted there,
+# so their construction (databag parsing, checksums) can be skipped entirely.
+_MINIMAL_DISPATCH_SUFFIXES = (
+    f"{WORKLOAD_CONTAINER}-pebble-check-failed",
+    f"{WORKLOAD_CONTAINER}-pebble-check-recovered",
+)
+
+_METRICS_TARGET = f"*:{PORT}"
+_PROMETHEUS_JOBS = [
+    {
+        "job_name": "hook_service_metrics",
+        "metrics_path": "/api/v0/metrics",
+        "static_configs": [
+            {
+                "targets": [_METRICS_TARGET],
+            }
+        ],
+    }
+]
+
+
+@lru_cache(maxsize=4)
+def _resource_requirements(cpu: str | None, memory: str | None) -> ResourceRequirements:
+    return adjust_resource_requirements(
+        {"cpu": cpu, "memory": memory}, _DEFAULT_RESOURCE_REQUESTS, adhere_to_requests=True
+    )
+
 
 class HookServiceOperatorCharm(ops.CharmBase):
     """Charm the application."""
 
+    # (event source path, handler name) pairs registered in one loop at init,
+    # instead of ~35 individual observe calls on every dispatch. Paths are
+    # resolved against the charm instance with attrgetters precompiled at
+    # class-definition time, so nested sources (requirer event buses, the
+    # framework commit event) fit in the same table.
+    _OBSERVER_SPEC: ClassVar[
+        tuple[tuple[Callable[["HookServiceOperatorCharm"], Any], str], ...]
+    ] = tuple(
+        (attrgetter(path), handler)
+        for path, handler in (
+            ("framework.on.commit", "_flush_reconcile"),
+            ("on.hook_service_pebble_ready", "_on_pebble_ready"),
+            ("on.hook_service_pebble_check_failed", "_on_pebble_check_failed"),
+            ("on.hook_service_pebble_check_recovered", "_on_pebble_check_recovered"),
+            ("on.config_changed", "_on_config_changed"),
+            ("on.leader_elected", "_on_leader_elected"),
+            ("on.leader_settings_changed", "_on_leader_settings_changed"),
+            ("on.collect_unit_status", "_on_collect_status"),
+            ("on.secret_changed", "_on_secret_changed"),
+            ("on.get_access_token_action", "_on_get_access_token_action"),
+            ("on.create_group_action", "_on_create_group_action"),
+            ("on.delete_group_action", "_on_delete_group_action"),
+            ("on.list_groups_action", "_on_list_groups_action"),
+            ("on.import_groups_action", "_on_import_groups_action"),
+            ("on.users_delete_action", "_on_users_delete_action"),
+            ("on.users_list_groups_action", "_on_users_list_groups_action"),
+            ("on.users_set_groups_action", "_on_users_set_groups_action"),
+            ("on.groups_add_users_action", "_on_groups_add_users_action"),
+            ("on.groups_remove_users_action", "_on_groups_remove_users_action"),
+            ("on.groups_list_users_action", "_on_groups_list_users_action"),
+            # Hydra token hook relation
+            ("hydra_token_hook.on.ready", "_on_hydra_hook_ready"),
+            # Oauth relation
+            ("oauth_requirer.on.oauth_info_changed", "_on_oauth_info_changed"),
+            ("oauth_requirer.on.oauth_info_removed", "_on_oauth_info_changed"),
+            # Certificate transfer relation
+            (
+                "certificate_transfer_requirer.on.certificate_set_updated",
+                "_on_certificate_transfer_changed",
+            ),
+            (
+                "certificate_transfer_requirer.on.certificates_removed",
+                "_on_certificate_transfer_changed",
+            ),
+            # Tenant service info relation
+            (
+                "tenant_service_info_requirer.on.tenant_service_info_changed",
+                "_on_tenant_service_info_changed",
+            ),
+            (
+                "tenant_service_info_requirer.on.tenant_service_info_removed",
+                "_on_tenant_service_info_changed",
+            ),
+            # resource patching
+            ("resources_patch.on.patch_failed", "_on_resource_patch_failed"),
+            # database
+            ("database_requirer.on.database_created", "_on_database_created"),
+            ("database_requirer.on.endpoints_changed", "_on_database_changed"),
+            ("on.pg_database_relation_broken", "_on_database_integration_broken"),
+            # internal route
+            ("on.internal_route_relation_joined", "_on_internal_route_changed"),
+            ("on.internal_route_relation_changed", "_on_internal_route_changed"),
+            ("on.internal_route_relation_broken", "_on_internal_route_changed"),
+            # openfga
+            ("openfga_requirer.on.openfga_store_created", "_on_openfga_store_created"),
+            ("openfga_requirer.on.openfga_store_removed", "_on_openfga_store_removed"),
+        )
+    )
+
+    _stored = ops.StoredState()
+
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
 
+        self._stored.set_default(last_workload_version="")
+        self._reconcile_pending = False
+        self._condition_cache: dict[Condition, bool] = {}
+
         self._container = self.unit.get_container(WORKLOAD_CONTAINER)
-        self._cli = CommandLine(self._container)
-        self.peer_data = PeerData(self.model)
-        self._workload_service = WorkloadService(self.unit)
-        self._pebble_service = PebbleService(self.unit)
-        self._secrets = Secrets(self.model)
-        self._config = CharmConfig(self.config, self.model)
 
         self.oauth_requirer = OAuthRequirer(self, relation_name=OAUTH_INTEGRATION_NAME)
-        self.oauth_integration = OAuthIntegration(self.oauth_requirer)
 
         self.hydra_token_hook = HydraHookProvider(self)
-        self.hydra_token_hook_integration = HydraHookIntegration(self.hydra_token_hook)
 
         self.openfga_requirer = OpenFGARequires(
             self, store_name=OPENFGA_STORE_NAME, relation_name=OPENFGA_INTEGRATION_NAME
         )
-        self.openfga_integration = OpenFGAIntegration(self.openfga_requirer)
 
         self.database_requirer = DatabaseRequires(
             self,
@@ -130,29 +229,29 @@ class HookServiceOperatorCharm(ops.CharmBase):
             database_name=f"{self.model.name}_{self.app.name}",
         )
 
+        self._internal_route_relation = self.model.get_relation(INTERNAL_ROUTE_INTEGRATION_NAME)
         self.internal_ingress = TraefikRouteRequirer(
             self,
-            self.model.get_relation(INTERNAL_ROUTE_INTEGRATION_NAME),  # type: ignore
+            self._internal_route_relation,  # type: ignore
             INTERNAL_ROUTE_INTEGRATION_NAME,
             raw=True,
         )
 
-        self.metrics_endpoint = MetricsEndpointProvider(
-            self,
-            relation_name=PROMETHEUS_SCRAPE_INTEGRATION_NAME,
-            jobs=[
-                {
-                    "job_name": "hook_service_metrics",
-                    "metrics_path": "/api/v0/metrics",
-                    "static_configs": [
-                        {
-                            "targets": [f"*:{PORT}"],
-                        }
-                    ],
-                }
-            ],
+        self._minimal_dispatch = os.environ.get("JUJU_DISPATCH_PATH", "").endswith(
+            _MINIMAL_DISPATCH_SUFFIXES
         )
 
+        if not self._minimal_dispatch:
+            # Deferred import: the observability libs pull in YAML parsing and
+            # pydantic models that minimal dispatches never touch.
+            from charms.prometheus_k8s.v0.prometheus_scrape import MetricsEndpointProvider
+
+            self.metrics_endpoint = MetricsEndpointProvider(
+                self,
+                relation_name=PROMETHEUS_SCRAPE_INTEGRATION_NAME,
+                jobs=_PROMETHEUS_JOBS,
+            )
+
         self.resources_patch = KubernetesComputeResourcesPatch(
             self,
             WORKLOAD_CONTAINER,
@@ -168,118 +267,116 @@ class HookServiceOperatorCharm(ops.CharmBase):
             self, relation_name=TENANT_SERVICE_INFO_INTEGRATION_NAME
         )
 
-        self.framework.observe(self.on.hook_service_pebble_ready, self._on_pebble_ready)
-        self.framework.observe(
-            self.on.hook_service_pebble_check_failed, self._on_pebble_check_failed
-        )
-        self.framework.observe(
-            self.on.hook_service_pebble_check_recovered, self._on_pebble_check_recovered
-        )
-        self.framework.observe(self.on.config_changed, self._on_config_changed)
-        self.framework.observe(self.on.leader_elected, self._on_leader_elected)
-        self.framework.observe(self.on.leader_settings_changed, self._on_leader_settings_changed)
-        self.framework.observe(self.on.collect_unit_status, self._on_collect_status)
-        self.framework.observe(self.on.secret_changed, self._on_secret_changed)
-        self.framework.observe(self.on.get_access_token_action, self._on_get_access_token_action)
-        self.framework.observe(self.on.create_group_action, self._on_create_group_action)
-        self.framework.observe(self.on.delete_group_action, self._on_delete_group_action)
-        self.framework.observe(self.on.list_groups_action, self._on_list_groups_action)
-        self.framework.observe(self.on.import_groups_action, self._on_import_groups_action)
-        self.framework.observe(self.on.users_delete_action, self._on_users_delete_action)
-        self.framework.observe(self.on.users_list_groups_action, self._on_users_list_groups_action)
-        self.framework.observe(self.on.users_set_groups_action, self._on_users_set_groups_action)
-        self.framework.observe(self.on.groups_add_users_action, self._on_groups_add_users_action)
-        self.framework.observe(
-            self.on.groups_remove_users_action, self._on_groups_remove_users_action
-        )
-        self.framework.observe(self.on.groups_list_users_action, self._on_groups_list_users_action)
+        for get_source, handler_name in self._OBSERVER_SPEC:
+            self.framework.observe(get_source(self), getattr(self, handler_name))
 
-        # Hydra token hook relation
-        self.framework.observe(self.hydra_token_hook.on.ready, self._on_hydra_hook_ready)
+        # COS relations
+        if not self._minimal_dispatch:
+            from charms.tempo_coordinator_k8s.v0.tracing import TracingEndpointRequirer
 
-        # Oauth relation
-        self.framework.observe(
-            self.oauth_requirer.on.oauth_info_changed,
-            self._on_oauth_info_changed,
-        )
-        self.framework.observe(
-            self.oauth_requirer.on.oauth_info_removed,
-            self._on_oauth_info_changed,
-        )
+            if self._integration_in_play(LOGGING_INTEGRATION_NAME):
+                from charms.loki_k8s.v1.loki_push_api import LogForwarder
 
-        # Certificate transfer relation
-        self.framework.observe(
-            self.certificate_transfer_requirer.on.certificate_set_updated,
-            self._on_certificate_transfer_changed,
-        )
-        self.framework.observe(
-            self.certificate_transfer_requirer.on.certificates_removed,
-            self._on_certificate_transfer_changed,
-        )
+                self._log_forwarder = LogForwarder(self, relation_name=LOGGING_INTEGRATION_NAME)
 
-        # Tenant service info relation
-        self.framework.observe(
-            self.tenant_service_info_requirer.on.tenant_service_info_changed,
-            self._on_tenant_service_info_changed,
-        )
-        self.framework.observe(
-            self.tenant_service_info_requirer.on.tenant_service_info_removed,
-            self._on_tenant_service_info_changed,
-        )
+            if self._integration_in_play(GRAFANA_DASHBOARD_INTEGRATION_NAME):
+                from charms.grafana_k8s.v0.grafana_dashboard import GrafanaDashboardProvider
 
-        # COS relations
-        self._log_forwarder = LogForwarder(self, relation_name=LOGGING_INTEGRATION_NAME)
+                self._grafana_dashboards = GrafanaDashboardProvider(
+                    self,
+                    relation_name=GRAFANA_DASHBOARD_INTEGRATION_NAME,
+                )
 
-        self._grafana_dashboards = GrafanaDashboardProvider(
-            self,
-            relation_name=GRAFANA_DASHBOARD_INTEGRATION_NAME,
-        )
+            self.tracing_requirer = TracingEndpointRequirer(
+                self, relation_name=TEMPO_TRACING_INTEGRATION_NAME, protocols=["otlp_http"]
+            )
 
-        self.tracing_requirer = TracingEndpointRequirer(
-            self, relation_name=TEMPO_TRACING_INTEGRATION_NAME, protocols=["otlp_http"]
+    # The relation-library providers above must be built in __init__ so their
+    # observers are registered on every dispatch. The charm's own helpers carry
+    # no observers, so they are built lazily, only for the events that use them.
+    def _integration_in_play(self, integration_name: str) -> bool:
+        """The integration exists, or this dispatch is one of its own hooks.
+
+        The env check keeps relation-broken handling intact: the relation is
+        gone from the model by then, but its provider must still observe the
+        event to clean up.
+        """
+        return bool(
+            self.model.relations[integration_name]
+            or os.environ.get("JUJU_RELATION") == integration_name
         )
 
-        # resource patching
-        self.framework.observe(
-            self.resources_patch.on.patch_failed, self._on_resource_patch_failed
-        )
+    @cached_property
+    def _is_leader(self) -> bool:
+        return self.unit.is_leader()
 
-        # database
-        self.framework.observe(
-            self.database_requirer.on.database_created, self._on_database_created
-        )
-        self.framework.observe(
-            self.database_requirer.on.endpoints_changed, self._on_database_changed
-        )
-        self.framework.observe(
-            self.on[DATABASE_INTEGRATION_NAME].relation_broken,
-            self._on_database_integration_broken,
-        )
+    @cached_property
+    def _cli(self) -> CommandLine:
+        return CommandLine(self._container)
 
-        # internal route
-        self.framework.observe(
-            self.on[INTERNAL_ROUTE_INTEGRATION_NAME].relation_joined,
-            self._on_internal_route_changed,
-        )
-        self.framework.observe(
-            self.on[INTERNAL_ROUTE_INTEGRATION_NAME].relation_changed,
-            self._on_internal_route_changed,
-        )
-        self.framework.observe(
-            self.on[INTERNAL_ROUTE_INTEGRATION_NAME].relation_broken,
-            self._on_internal_route_changed,
-        )
+    @cached_property
+    def peer_data(self) -> PeerData:
+        return PeerData(self.model)
 
-        self.framework.observe(
-            self.openfga_requirer.on.openfga_store_created,
-            self._on_openfga_store_created,
-        )
-        self.framework.observe(
-            self.openfga_requirer.on.openfga_store_removed,
-            self._on_openfga_store_removed,
-        )
+    @cached_property
+    def _workload_service(self) -> WorkloadService:
+        return WorkloadService(self.unit, self._container)
 
-    @property
+    @cached_property
+    def _pebble_service(self) -> PebbleService:
+        return PebbleService(self.unit, self._container)
+
+    @cached_property
+    def _secrets(self) -> Secrets:
+        return Secrets(self.model)
+
+    @cached_property
+    def _config(self) -> CharmConfig:
+        return CharmConfig(self.config, self.model)
+
+    @cached_property
+    def oauth_integration(self) -> OAuthIntegration:
+        return OAuthIntegration(self.oauth_requirer)
+
+    @cached_property
+    def hydra_token_hook_integration(self) -> HydraHookIntegration:
+        return HydraHookIntegration(self.hydra_token_hook)
+
+    @cached_property
+    def openfga_integration(self) -> OpenFGAIntegration:
+        return OpenFGAIntegration(self.openfga_requirer)
+
+    # Integration data loaders, memoized for the duration of the hook so the
+    # ensure-steps and the pebble layer render parse each databag only once.
+    @cached_property
+    def _tracing_data(self) -> TracingData:
+        return TracingData.load(self.tracing_requirer)
+
+    @cached_property
+    def _internal_ingress_data(self) -> InternalIngressData:
+        return InternalIngressData.load(self.internal_ingress)
+
+    @cached_property
+    def _peer_bucket(self) -> dict[str, str] | str:
+        """The peer-data bucket keyed by the running workload version.
+
+        Caching this also caches the version lookup, which is a Pebble exec.
+        """
+        return self.peer_data[self._workload_service.version]
+
+    @cached_property
+    def _openfga_model_data(self) -> OpenFGAModelData:
+        return OpenFGAModelData.load(self._peer_bucket)
+
+    @cached_property
+    def _openfga_integration_data(self) -> OpenFGAIntegrationData:
+        return self.openfga_integration.openfga_integration_data
+
+    @cached_property
+    def _tenant_service_info_data(self) -> TenantServiceInfoData:
+        return TenantServiceInfoData.load(self.model)
+
+    @cached_property
     def _pebble_layer(self) -> ops.pebble.Layer:
         oauth_config = self._config.get_oauth_config()
         oauth_provider_data = self.oauth_integration.get_oauth_provider_data(
@@ -290,61 +387,81 @@ class HookServiceOperatorCharm(ops.CharmBase):
         )
 
         return self._pebble_service.render_pebble_layer(
-            TracingData.load(self.tracing_requirer),
-            DatabaseConfig.load(self.database_requirer),
+            self._tracing_data,
+            self._database_config,
             self._secrets,
             self._config,
-            OpenFGAModelData.load(self.peer_data[self._workload_service.version]),
-            self.openfga_integration.openfga_integration_data,
+            self._openfga_model_data,
+            self._openfga_integration_data,
             oauth_provider_data,
-            TenantServiceInfoData.load(self.model),
+            self._tenant_service_info_data,
         )
 
-    @property
+    @cached_property
     def _hydra_hook_url(self) -> str:
         if self._config.use_ingress_for_relations:
-            internal_url = InternalIngressData.load(self.internal_ingress).url
+            internal_url = self._internal_ingress_data.url
             if internal_url:
-                return join(str(internal_url), "api/v0/hook/hydra")
+                # os.path.join is wrong for URLs (an absolute path would drop
+                # the scheme); plain string formatting is also cheaper.
+                base = str(internal_url)
+                return f"{base.rstrip('/')}/api/v0/hook/hydra"
         return (
             f"http://{self.app.name}.{self.model.name}.svc.cluster.local:{PORT}/api/v0/hook/hydra"
         )
 
+    @cached_property
+    def _database_config(self) -> DatabaseConfig:
+        return DatabaseConfig.load(self.database_requirer)
+
     @property
     def migration_needed(self) -> bool:
         """Check if database migration is needed."""
         if not self.database_requirer.is_resource_created():
             return False
 
-        database_config = DatabaseConfig.load(self.database_requirer)
-        return not self._cli.migration_check(dsn=database_config.dsn)
+        dsn = self._database_config.dsn
+        fingerprint = hashlib.blake2b(
+            f"{dsn}{self._workload_service.version}".encode(), digest_size=16
+        ).hexdigest()
+        if self.peer_data[MIGRATION_OK_FINGERPRINT] == fingerprint:
+            return False
+
+        needed = not self._cli.migration_check(dsn=dsn)
+        if not needed and self._is_leader:
+            self.peer_data[MIGRATION_OK_FINGERPRINT] = fingerprint
+        return needed
 
     def _ensure_secrets(self) -> bool:
         if self._secrets.is_ready():
             return True
 
-        if self.unit.is_leader():
+        if self._is_leader:
+            # Deferred import: only the leader seeds the token, effectively
+            # once per deployment.
+            from secrets import token_hex
+
             self._secrets[API_TOKEN_SECRET_LABEL] = {API_TOKEN_SECRET_KEY: token_hex(16)}
             return True
         return False
 
     def _ensure_hydra_relation(self) -> bool:
-        if self.unit.is_leader() and self.hydra_token_hook_integration.is_ready():
+        if self._is_leader and self.hydra_token_hook_integration.is_ready():
             self.hydra_token_hook_integration.update_relation_data(
                 self._hydra_hook_url,
                 self._secrets.api_token,
-                tenant_service_ready=bool(TenantServiceInfoData.load(self.model).service_url),
+                tenant_service_ready=bool(self._tenant_service_info_data.service_url),
             )
         return True
 
     def _ensure_internal_ingress(self) -> bool:
         # This always returns true if the unit is not the leader, can't we simplify this function?
         if (
-            self.unit.is_leader()
+            self._is_leader
             and self.internal_ingress.is_ready()
             and self.internal_ingress._relation.app is not None
         ):
-            internal_route_config = InternalIngressData.load(self.internal_ingress).config
+            internal_route_config = self._internal_ingress_data.config
             self.internal_ingress.submit_to_traefik(internal_route_config)
         return True
 
@@ -352,15 +469,14 @@ class HookServiceOperatorCharm(ops.CharmBase):
         if migration_is_ready(self):
             return True
 
-        if not self.unit.is_leader():
+        if not self._is_leader:
             logger.info(
                 "Unit does not have leadership. Wait for leader unit to run the migration."
             )
             return False
 
-        database_config = DatabaseConfig.load(self.database_requirer)
         try:
-            self._cli.migrate_up(dsn=database_config.dsn)
+            self._cli.migrate_up(dsn=self._database_config.dsn)
         except MigrationError:
             logger.error("Auto migration job failed. Please use the run-migration-up action")
             return False
@@ -377,40 +493,83 @@ class HookServiceOperatorCharm(ops.CharmBase):
         if not peer_integration_exists(self):
             return False
 
-        if self.peer_data[self._workload_service.version].get(OPENFGA_MODEL_ID):
+        if self._peer_bucket.get(OPENFGA_MODEL_ID):
             return True
 
-        if not self.unit.is_leader():
+        if not self._is_leader:
             return False
 
         try:
             openfga_model_id = self._workload_service.create_openfga_model(
-                self.openfga_integration.openfga_integration_data
+                self._openfga_integration_data
             )
         except CreateFgaStoreError:
             logger.exception("Failed to create OpenFGA model")
             return False
 
         self.peer_data[self._workload_service.version] = {OPENFGA_MODEL_ID: openfga_model_id}
+        # the cached views of the peer databag are stale now
+        self.__dict__.pop("_peer_bucket", None)
+        self.__dict__.pop("_openfga_model_data", None)
         return True
 
     def _ensure_tls(self) -> bool:
         LOCAL_CHARM_CERTIFICATES_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-        if certificates := TLSCertificates.load(self.certificate_transfer_requirer).ca_bundle:
+        certificates = TLSCertificates.load(self.certificate_transfer_requirer).ca_bundle
+        # update-ca-certificates rehashes the whole trust store; a sidecar hash
+        # of the last written bundle lets us skip it when nothing changed.
+        hash_file = LOCAL_CHARM_CERTIFICATES_FILE.with_suffix(".sha256")
+
+        new_hash = ""
+        if certificates:
+            new_hash = hashlib.sha256(certificates.encode()).hexdigest()
+            if (
+                LOCAL_CHARM_CERTIFICATES_FILE.exists()
+                and hash_file.exists()
+                and hash_file.read_text() == new_hash
+            ):
+                # A workload container restart wipes the pushed bundle while the
+                # charm-side hash still matches; update_ca_certs is an idempotent
+                # pull/compare/push, so the skip only saves the subprocess below.
+                self._workload_service.update_ca_certs()
+                return True
             LOCAL_CHARM_CERTIFICATES_FILE.write_text(certificates)
-        elif LOCAL_CHARM_CERTIFICATES_FILE.exists():
-            LOCAL_CHARM_CERTIFICATES_FILE.unlink()
-
-        subprocess.run([
-            "update-ca-certificates",
-            "--fresh",
-            "--etccertsdir",
-            LOCAL_CERTIFICATES_PATH,
-            "--localcertsdir",
-            LOCAL_CHARM_CERTIFICATES_PATH,
-        ])
+        else:
+            if not LOCAL_CHARM_CERTIFICATES_FILE.exists() and not hash_file.exists():
+                return True
+            LOCAL_CHARM_CERTIFICATES_FILE.unlink(missing_ok=True)
+
+        try:
+            result = subprocess.run(
+                [
+                    "update-ca-certificates",
+                    "--fresh",
+                    "--etccertsdir",
+                    LOCAL_CERTIFICATES_PATH,
+                    "--localcertsdir",
+                    LOCAL_CHARM_CERTIFICATES_PATH,
+                ],
+                check=False,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        except subprocess.TimeoutExpired:
+            logger.error("update-ca-certificates timed out")
+            raise CharmError("Failed to update the CA certificates")
+        if result.returncode != 0:
+            logger.error("update-ca-certificates failed: %s", result.stderr)
+            raise CharmError("Failed to update the CA certificates")
+
         self._workload_service.update_ca_certs()
+
+        # Persist the hash only once the refresh and the cert push succeeded;
+        # a failure above must leave a mismatch so the next hook retries.
+        if certificates:
+            hash_file.write_text(new_hash)
+        else:
+            hash_file.unlink(missing_ok=True)
         return True
 
     def _on_internal_route_changed(self, event: ops.RelationEvent) -> None:
@@ -449,8 +608,10 @@ class HookServiceOperatorCharm(ops.CharmBase):
         self._holistic_handler(event)
 
     def _on_openfga_store_removed(self, event: OpenFGAStoreRemovedEvent) -> None:
-        if self.unit.is_leader():
+        if self._is_leader:
             self.peer_data.pop(key=self._workload_service.version)
+            self.__dict__.pop("_peer_bucket", None)
+            self.__dict__.pop("_openfga_model_data", None)
 
         self._holistic_handler(event)
 
@@ -464,7 +625,12 @@ class HookServiceOperatorCharm(ops.CharmBase):
         self._workload_service.open_port()
         self._holistic_handler(event)
 
-        self._workload_service.set_version()
+        # Pebble can report ready repeatedly (e.g. on restarts); only pay the
+        # workload-version RPC when the version actually changed.
+        version = self._workload_service.version
+        if version != self._stored.last_workload_version:
+            self._workload_service.set_version()
+            self._stored.last_workload_version = version
 
     def _on_resource_patch_failed(self, event: K8sResourcePatchFailedEvent) -> None:
         logger.error("Resource patching failed: %s", event.message)
@@ -479,25 +645,49 @@ class HookServiceOperatorCharm(ops.CharmBase):
             logger.info("The service is online again")
 
     def _holistic_handler(self, event: ops.EventBase) -> None:
-        if not all(condition(self) for condition in NOOP_CONDITIONS):
+        """Schedule a reconciliation run for the end of the current hook.
+
+        Many observers funnel into this handler. Instead of reconciling once per
+        observer, mark the charm dirty and run the expensive reconciliation
+        pipeline exactly once, when the framework commits.
+        """
+        self._reconcile_pending = True
+
+    def _flush_reconcile(self, event: ops.EventBase) -> None:
+        if not self._reconcile_pending:
+            return
+
+        self._reconcile_pending = False
+        self._reconcile(event)
+
+    def _condition(self, condition: Condition) -> bool:
+        """Evaluate a condition, memoizing the result for the rest of the hook.
+
+        Most conditions probe Pebble or the model; evaluating each of them once
+        per dispatch is enough, as their inputs cannot change mid-hook.
+        """
+        result = self._condition_cache.get(condition)
+        if result is None:
+            self._condition_cache[condition] = result = condition(self)
+        return result
+
+    def _reconcile(self, event: ops.EventBase) -> None:
+        if not all(self._condition(condition) for condition in NOOP_CONDITIONS):
             return
 
-        can_plan = True
-        for f in [
+        for f in (
             self._ensure_secrets,
             self._ensure_hydra_relation,
             self._ensure_internal_ingress,
             self._ensure_database_migration,
             self._ensure_openfga_model,
             self._ensure_tls,
-        ]:
+        ):
             try:
-                can_plan = can_plan and f()
+                if not f():
+                    return
             except CharmError:
-                can_plan = False
-
-        if not can_plan:
-            return
+                return
 
         try:
             self._pebble_service.plan(self._pebble_layer)
@@ -515,44 +705,77 @@ class HookServiceOperatorCharm(ops.CharmBase):
             return ops.BlockedStatus(f"Migration check failed: {e}")
 
         if not is_migration_ready:
-            if self.unit.is_leader():
+            if self._is_leader:
                 return ops.WaitingStatus("Waiting for database migration")
             return ops.WaitingStatus("Waiting for leader unit to run the migration")
         return None
 
     def _on_collect_status(self, event: ops.CollectStatusEvent) -> None:
-        if not (can_connect := container_connectivity(self)):
+        # collect-status runs after the triggering event but before commit, so
+        # flushing the pending reconcile here lets the statuses below reflect
+        # this dispatch's work; the commit observer stays as a fallback for
+        # restricted dispatches that skip collect-status.
+        self._flush_reconcile(event)
+
+        # Guarded chain: stop at the first unmet prerequisite so the later,
+        # more expensive probes (workload checks, migration check exec) never
+        # run while an earlier one already determines the status.
+        if not self._condition(container_connectivity):
             event.add_status(ops.WaitingStatus("Container is not connected yet"))
+            return
 
-        event.add_status(authentication_config_status(self))
+        authentication_status = authentication_config_status(self)
+        event.add_status(authentication_status)
+        if not isinstance(authentication_status, ops.ActiveStatus):
+            return
 
         if not self._secrets.is_ready():
             event.add_status(ops.WaitingStatus("Waiting for secrets creation"))
+            return
 
-        if can_connect and self._workload_service.is_failing():
+        if self._workload_service.is_failing():
             event.add_status(
                 ops.BlockedStatus(
                     f"Failed to start the service, please check the {WORKLOAD_CONTAINER} container logs"
                 )
             )
+            return
 
-        if not database_integration_exists(self):
+        if not self._collect_data_statuses(event):
+            return
+
+        event.add_status(self.resources_patch.get_status())
+        event.add_status(ops.ActiveStatus())
+
+    def _collect_data_statuses(self, event: ops.CollectStatusEvent) -> bool:
+        """Collect the database, openfga and migration statuses.
+
+        Returns False when a status settling the unit state was added.
+        """
+        if not self._condition(database_integration_exists):
             event.add_status(ops.BlockedStatus(f"Missing integration {DATABASE_INTEGRATION_NAME}"))
+            return False
 
-        if not database_resource_is_created(self):
+        if not self._condition(database_resource_is_created):
             event.add_status(ops.WaitingStatus("Waiting for database creation"))
+            return False
 
-        if self._config.authorization_enabled and not openfga_integration_exists(self):
-            event.add_status(ops.BlockedStatus(f"Missing integration {OPENFGA_INTEGRATION_NAME}"))
+        if self._config.authorization_enabled:
+            if not self._condition(openfga_integration_exists):
+                event.add_status(
+                    ops.BlockedStatus(f"Missing integration {OPENFGA_INTEGRATION_NAME}")
+                )
+                return False
 
-        if self._config.authorization_enabled and not self.openfga_integration.is_store_ready():
-            event.add_status(ops.WaitingStatus("Waiting for openfga store to be created"))
+            if not self.openfga_integration.is_store_ready():
+                event.add_status(ops.WaitingStatus("Waiting for openfga store to be created"))
+                return False
 
         if migration_status := self._get_migration_status():
             event.add_status(migration_status)
+            return False
 
-        event.add_status(self.resources_patch.get_status())
-        event.add_status(ops.ActiveStatus())
+        return True
 
     def _on_get_access_token_action(self, event: ops.ActionEvent) -> None:
         """Handle the get-access-token action."""
@@ -664,7 +887,7 @@ class HookServiceOperatorCharm(ops.CharmBase):
             openfga_host = openfga_data.api_host
             openfga_store_id = openfga_data.store_id
             openfga_token = openfga_data.api_token
-            version_data = self.peer_data[self._workload_service.version]
+            version_data = self._peer_bucket
             openfga_model_id = (
                 version_data.get(OPENFGA_MODEL_ID, "") if isinstance(version_data, dict) else ""
             )
@@ -789,9 +1012,9 @@ class HookServiceOperatorCharm(ops.CharmBase):
             event.fail(f"Failed to list users in group: {e}")
 
     def _resource_reqs_from_config(self) -> ResourceRequirements:
-        limits = {"cpu": self.model.config.get("cpu"), "memory": self.model.config.get("memory")}
-        requests = {"cpu": "100m", "memory": "200Mi"}
-        return adjust_resource_requirements(limits, requests, adhere_to_requests=True)
+        return _resource_requirements(
+            self.model.config.get("cpu"), self.model.config.get("memory")
+        )
 
 
 if __name__ == "__main__":  # pragma: nocover
@@ -3,10 +3,11 @@
 
 """Helper class to access the service CLI."""
 
+from __future__ import annotations
+
 import json
 import logging
-import re
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import BinaryIO, Optional, TextIO
 
 from ops.model import Container
@@ -16,8 +17,6 @@ from constants import WORKLOAD_SERVICE
 from env_vars import EnvVars
 from exceptions import CharmError, CreateFgaStoreError, MigrationCheckError, MigrationError
 
-VERSION_REGEX = re.compile(r"App Version:\s*(?P<version>\S+)\s*$")
-
 logger = logging.getLogger(__name__)
 
 
@@ -30,16 +29,51 @@ class CmdExecConfig:
     timeout: float = 20
     stdin: Optional[str | bytes | TextIO | BinaryIO] = None
 
+    def to_exec_kwargs(self) -> dict:
+        """Return the keyword arguments for `Container.exec`.
+
+        Unlike `dataclasses.asdict`, this does not deep-copy the environment,
+        and unset optional fields are omitted so they are never marshalled to
+        the Pebble API.
+        """
+        kwargs: dict = {"environment": self.environment, "timeout": self.timeout}
+        if self.service_context is not None:
+            kwargs["service_context"] = self.service_context
+        if self.stdin is not None:
+            kwargs["stdin"] = self.stdin
+        return kwargs
+
+
+_DEFAULT_EXEC_CONFIG = CmdExecConfig()
+# Shared config for commands that run in the workload service context with the
+# default timeout; reused so a new dataclass isn't allocated per call.
+_SERVICE_EXEC_CONFIG = CmdExecConfig(service_context=WORKLOAD_SERVICE)
+
+# Constant command fragments, hoisted so the per-call lists are a single splat
+# of pre-built tuples rather than rebuilt element by element.
+_CMD_VERSION = ("hook-service", "version")
+_CMD_MIGRATE_UP_PREFIX = ("hook-service", "migrate", "up", "--dsn")
+_CMD_MIGRATE_DOWN_PREFIX = ("hook-service", "migrate", "down", "--dsn")
+_CMD_MIGRATE_CHECK_PREFIX = ("hook-service", "migrate", "check", "--dsn")
+_CMD_JSON_FORMAT = ("-f", "json")
+
 
 class CommandLine:
     """A class to handle command line interactions with the service."""
 
     def __init__(self, container: Container):
         self.container = container
+        # Memoized per charm object (one hook): each CLI call is a Pebble exec
+        # round-trip into the workload container.
+        self._version: Optional[str] = None
+        self._migration_checks: dict[str, bool] = {}
 
     def get_service_version(self) -> Optional[str]:
         """Get the service version."""
-        cmd = ["hook-service", "version"]
+        if self._version is not None:
+            return self._version
+
+        cmd = [*_CMD_VERSION]
 
         try:
             stdout, _ = self._run_cmd(cmd)
@@ -47,8 +81,12 @@ class CommandLine:
             logger.error("Failed to fetch the service version: %s", err)
             return None
 
-        matched = VERSION_REGEX.search(stdout)
-        return matched.group("version") if matched else None
+        # Cheaper than scanning the full output with a regex: everything after
+        # the last "App Version:" marker, first whitespace-delimited token.
+        _, sep, tail = stdout.rpartition("App Version:")
+        fields = tail.split(None, 1)
+        self._version = fields[0] if sep and fields else None
+        return self._version
 
     def create_openfga_model(
         self,
@@ -88,15 +126,7 @@ class CommandLine:
         Raises:
             MigrationError: If the migration fails.
         """
-        cmd = [
-            "hook-service",
-            "migrate",
-            "up",
-            "--dsn",
-            dsn,
-            "-f",
-            "json",
-        ]
+        cmd = [*_CMD_MIGRATE_UP_PREFIX, dsn, *_CMD_JSON_FORMAT]
 
         try:
             self._run_cmd(
@@ -107,6 +137,8 @@ class CommandLine:
             logger.error("Failed to migrate up the service: %s", err)
             raise MigrationError from err
 
+        self._migration_checks.pop(dsn, None)
+
     def migrate_down(self, dsn: str, version: Optional[str] = None, timeout: float = 120) -> None:
         """Migrate the service down to a specific version using the provided DSN.
 
@@ -118,15 +150,7 @@ class CommandLine:
         Raises:
             MigrationError: If the migration fails.
         """
-        cmd = [
-            "hook-service",
-            "migrate",
-            "down",
-            "--dsn",
-            dsn,
-            "-f",
-            "json",
-        ]
+        cmd = [*_CMD_MIGRATE_DOWN_PREFIX, dsn, *_CMD_JSON_FORMAT]
 
         if version:
             cmd.extend([version])
@@ -140,6 +164,8 @@ class CommandLine:
             logger.error("Failed to migrate down the service: %s", err)
             raise MigrationError from err
 
+        self._migration_checks.pop(dsn, None)
+
     def migration_check(self, dsn: str) -> bool:
         """Check the migration status of the service using the provided DSN.
 
@@ -152,20 +178,15 @@ class CommandLine:
         Raises:
             MigrationCheckError: If the migration check fails or returns an error.
         """
-        cmd = [
-            "hook-service",
-            "migrate",
-            "check",
-            "--dsn",
-            dsn,
-            "-f",
-            "json",
-        ]
+        if (cached := self._migration_checks.get(dsn)) is not None:
+            return cached
+
+        cmd = [*_CMD_MIGRATE_CHECK_PREFIX, dsn, *_CMD_JSON_FORMAT]
 
         try:
             stdout, stderr = self._run_cmd(
                 cmd,
-                exec_config=CmdExecConfig(service_context=WORKLOAD_SERVICE),
+                exec_config=_SERVICE_EXEC_CONFIG,
             )
         except Error as err:
             logger.error("Failed to check migration status: %s", err)
@@ -177,7 +198,9 @@ class CommandLine:
 
         out = json.loads(stdout)
 
-        return out.get("status") == "ok"
+        result = out.get("status") == "ok"
+        self._migration_checks[dsn] = result
+        return result
 
     def import_groups(
         self,
@@ -269,7 +292,7 @@ class CommandLine:
         ]
 
         try:
-            self._run_cmd(cmd, exec_config=CmdExecConfig(service_context=WORKLOAD_SERVICE))
+            self._run_cmd(cmd, exec_config=_SERVICE_EXEC_CONFIG)
         except Error as err:
             logger.error("Failed to delete user %s: %s", user_id, err)
             raise CharmError("Failed to run users delete command") from err
@@ -299,9 +322,7 @@ class CommandLine:
         ]
 
         try:
-            stdout, _ = self._run_cmd(
-                cmd, exec_config=CmdExecConfig(service_context=WORKLOAD_SERVICE)
-            )
+            stdout, _ = self._run_cmd(cmd, exec_config=_SERVICE_EXEC_CONFIG)
         except Error as err:
             logger.error("Failed to list groups for user %s: %s", user_id, err)
             raise CharmError("Failed to run users list-groups command") from err
@@ -331,7 +352,7 @@ class CommandLine:
             cmd.extend(["--group", group_id])
 
         try:
-            self._run_cmd(cmd, exec_config=CmdExecConfig(service_context=WORKLOAD_SERVICE))
+            self._run_cmd(cmd, exec_config=_SERVICE_EXEC_CONFIG)
         except Error as err:
             logger.error("Failed to set groups for user %s: %s", user_id, err)
             raise CharmError("Failed to run users set-groups command") from err
@@ -359,7 +380,7 @@ class CommandLine:
             cmd.extend(["--user", user_id])
 
         try:
-            self._run_cmd(cmd, exec_config=CmdExecConfig(service_context=WORKLOAD_SERVICE))
+            self._run_cmd(cmd, exec_config=_SERVICE_EXEC_CONFIG)
         except Error as err:
             logger.error("Failed to add users to group %s: %s", group_id, err)
             raise CharmError("Failed to run groups add-users command") from err
@@ -387,7 +408,7 @@ class CommandLine:
             cmd.extend(["--user", user_id])
 
         try:
-            self._run_cmd(cmd, exec_config=CmdExecConfig(service_context=WORKLOAD_SERVICE))
+            self._run_cmd(cmd, exec_config=_SERVICE_EXEC_CONFIG)
         except Error as err:
             logger.error("Failed to remove users from group %s: %s", group_id, err)
             raise CharmError("Failed to run groups remove-users command") from err
@@ -417,9 +438,7 @@ class CommandLine:
         ]
 
         try:
-            stdout, _ = self._run_cmd(
-                cmd, exec_config=CmdExecConfig(service_context=WORKLOAD_SERVICE)
-            )
+            stdout, _ = self._run_cmd(cmd, exec_config=_SERVICE_EXEC_CONFIG)
         except Error as err:
             logger.error("Failed to list users in group %s: %s", group_id, err)
             raise CharmError("Failed to run groups list-users command") from err
@@ -432,10 +451,10 @@ class CommandLine:
         exec_config: Optional[CmdExecConfig] = None,
     ) -> tuple[str, str]:
         if exec_config is None:
-            exec_config = CmdExecConfig()
+            exec_config = _DEFAULT_EXEC_CONFIG
         logger.debug("Running command: %s", cmd)
 
-        process = self.container.exec(cmd, **asdict(exec_config))
+        process = self.container.exec(cmd, **exec_config.to_exec_kwargs())
         try:
             stdout, stderr = process.wait_output()
         except ExecError as err:
@@ -1,13 +1,27 @@
 # Copyright 2026 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import time
 from types import TracebackType
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from typing_extensions import Self, Type
 
 from constants import PORT
 
+# Retry transient failures with a short backoff instead of surfacing them to
+# the hook. POST stays out of the shared policy so API calls with side effects
+# are never replayed after the server may already have processed them; the
+# token fetch is safe to replay and gets its own adapter.
+_RETRY_POLICY = Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+_TOKEN_RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+)
+
 
 class HTTPClient:
     def __init__(self, token_url: str = "", base_url: str = f"http://localhost:{PORT}") -> None:
@@ -15,6 +29,20 @@ class HTTPClient:
         self._base_url = base_url.rstrip("/")
         self._session = requests.Session()
         self._session.verify = False
+        self._session.headers["Accept"] = "application/json"
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=_RETRY_POLICY)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        if self._token_url:
+            self._session.mount(
+                self._token_url,
+                HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=_TOKEN_RETRY_POLICY),
+            )
+
+        # Tokens cached until shortly before expiry, keyed by credentials. No
+        # locking: charm hooks are single-threaded.
+        self._token_cache: dict[tuple[str, str], tuple[str, float]] = {}
 
     def __enter__(self) -> Self:
         return self
@@ -27,17 +55,26 @@ class HTTPClient:
     ) -> None:
         self._session.close()
 
+    _TOKEN_REQUEST_DATA = {"grant_type": "client_credentials"}
+
     def get_access_token(self, client_id: str, client_secret: str) -> str:
+        key = (client_id, client_secret)
+        if (cached := self._token_cache.get(key)) and time.monotonic() < cached[1]:
+            return cached[0]
+
         response = self._session.post(
             self._token_url,
-            data={
-                "grant_type": "client_credentials",
-            },
+            data=self._TOKEN_REQUEST_DATA,
             auth=(client_id, client_secret),
         )
         response.raise_for_status()
         token_data = response.json()
-        return token_data["access_token"]
+        token = token_data["access_token"]
+
+        # Refresh 30 seconds before the server-reported expiry.
+        expires_in = float(token_data.get("expires_in", 3600))
+        self._token_cache[key] = (token, time.monotonic() + expires_in - 30)
+        return token
 
     def create_group(
         self,
@@ -3,7 +3,8 @@
 
 """Helper class to manage the charm's config."""
 
-from typing import Any, Mapping, TypeAlias, cast
+from functools import cached_property
+from typing import Any, ClassVar, Mapping, TypeAlias, cast
 
 from ops import ConfigData, Model
 
@@ -15,26 +16,36 @@ ServiceConfigs: TypeAlias = Mapping[str, Any]
 class CharmConfig:
     """A class representing the data source of charm configurations."""
 
+    _OAUTH_KEYS: ClassVar[tuple[str, ...]] = (
+        "authn_allowed_subjects",
+        "authn_allowed_scope",
+        "authn_issuer",
+        "authn_jwks_url",
+    )
+
     def __init__(self, config: ConfigData, model: Model) -> None:
         self._config = config
         self._model = model
+        self._secret_cache: dict[str, dict[str, str]] = {}
 
     def _get_secret(self, id) -> dict[str, str]:
-        secret = self._model.get_secret(id=id)
-        return secret.get_content(refresh=True)
+        # Each secret-get is a hook-tool round-trip; cache per instance (one
+        # hook), refreshing only on the first fetch.
+        if (content := self._secret_cache.get(id)) is None:
+            secret = self._model.get_secret(id=id)
+            self._secret_cache[id] = content = secret.get_content(refresh=True)
+        return content
+
+    @cached_property
+    def _oauth_config(self) -> dict[str, str | None]:
+        return {k: cast(str, v) for k in self._OAUTH_KEYS if (v := self._config.get(k))}
 
     def get_oauth_config(self) -> dict[str, str | None]:
-        """Get OAuth config."""
-        return {
-            k: cast(str, v)
-            for k in [
-                "authn_allowed_subjects",
-                "authn_allowed_scope",
-                "authn_issuer",
-                "authn_jwks_url",
-            ]
-            if (v := self._config.get(k))
-        }
+        """Get OAuth config.
+
+        Config is immutable within a hook, so the dict is built once.
+        """
+        return self._oauth_config
 
     @property
     def authorization_enabled(self) -> bool:
@@ -46,14 +57,17 @@ class CharmConfig:
         """Check whether ingress URL should be used for relation endpoints."""
         return bool(self._config.get("use_ingress_for_relations", False))
 
-    def to_env_vars(self) -> EnvVars:
-        """Get config env vars."""
-        env = {
+    @cached_property
+    def _env_vars(self) -> EnvVars:
+        return {
             "LOG_LEVEL": self._config["log_level"].upper(),
             "AUTHORIZATION_ENABLED": self.authorization_enabled,
             "HTTP_PROXY": self._config.get("http_proxy"),
             "HTTPS_PROXY": self._config.get("https_proxy"),
             "NO_PROXY": self._config.get("no_proxy"),
-            **self.get_oauth_config(),
+            **self._oauth_config,
         }
-        return env
+
+    def to_env_vars(self) -> EnvVars:
+        """Get config env vars."""
+        return self._env_vars
@@ -5,9 +5,13 @@
 
 # Charm constants
 from pathlib import Path
-from string import Template
 
-POSTGRESQL_DSN_TEMPLATE = Template("postgres://$username:$password@$endpoint/$database")
+
+def build_postgres_dsn(username: str, password: str, endpoint: str, database: str) -> str:
+    """Build a PostgreSQL DSN; plain formatting, no Template substitution."""
+    return f"postgres://{username}:{password}@{endpoint}/{database}"
+
+
 WORKLOAD_CONTAINER = "hook-service"
 WORKLOAD_SERVICE = "hook-service"
 PEBBLE_READY_CHECK_NAME = "ready"
@@ -38,6 +42,7 @@ DATABASE_INTEGRATION_NAME = "pg-database"
 OPENFGA_INTEGRATION_NAME = "openfga"
 OPENFGA_STORE_NAME = "hook-service-store"
 OPENFGA_MODEL_ID = "openfga_model_id"
+MIGRATION_OK_FINGERPRINT = "migration_ok_fingerprint"
 PEER_INTEGRATION_NAME = "hook-service"
 OAUTH_INTEGRATION_NAME = "oauth"
 CERTIFICATE_TRANSFER_INTEGRATION_NAME = "receive-ca-cert"
@@ -3,13 +3,16 @@
 
 """Helper class with the application's the default env vars."""
 
+from types import MappingProxyType
 from typing import Mapping, Protocol, TypeAlias, Union
 
 from constants import PORT
 
 EnvVars: TypeAlias = Mapping[str, Union[str, bool]]
 
-DEFAULT_CONTAINER_ENV = {
+# Read-only view: shared module state that callers merge into their own env
+# dicts, so it must not be mutable.
+DEFAULT_CONTAINER_ENV: EnvVars = MappingProxyType({
     "OTEL_HTTP_ENDPOINT": "",
     "OTEL_GRPC_ENDPOINT": "",
     "TRACING_ENABLED": False,
@@ -18,7 +21,7 @@ DEFAULT_CONTAINER_ENV = {
     "API_TOKEN": "",
     "AUTHORIZATION_ENABLED": False,
     "TENANT_SERVICE_URL": "",
-}
+})
 
 
 class EnvVarConvertible(Protocol):
@@ -6,6 +6,7 @@
 import json
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Any, Optional
 from urllib.parse import urlparse
 
@@ -22,8 +23,8 @@ from charms.hydra.v0.oauth import ClientConfig, OAuthRequirer
 from charms.openfga_k8s.v1.openfga import OpenFGARequires
 from charms.tempo_coordinator_k8s.v0.tracing import TracingEndpointRequirer
 from charms.traefik_k8s.v0.traefik_route import TraefikRouteRequirer
-from jinja2 import Template
-from ops.model import Model
+from jinja2 import Environment, FileSystemLoader, Template
+from ops.model import Model, Relation
 from pydantic import AnyHttpUrl
 
 from constants import (
@@ -35,14 +36,44 @@ from constants import (
     OPENFGA_MODEL_ID,
     PEER_INTEGRATION_NAME,
     PORT,
-    POSTGRESQL_DSN_TEMPLATE,
     TENANT_SERVICE_INFO_INTEGRATION_NAME,
+    build_postgres_dsn,
 )
 from env_vars import EnvVars
 
 logger = logging.getLogger(__name__)
 
 
+# Caching happens in _get_ingress_template, so the environment's own template
+# cache is disabled to keep a single invalidation point.
+_TEMPLATES_ENV = Environment(loader=FileSystemLoader("templates"), auto_reload=False, cache_size=0)
+
+
+@lru_cache(maxsize=1)
+def _get_ingress_template() -> Template:
+    """Compile the internal-route template once per process."""
+    return _TEMPLATES_ENV.get_template("internal-route.json.j2")
+
+
+@lru_cache(maxsize=4)
+def _any_http_url(url: str) -> AnyHttpUrl:
+    """Validate a URL once per unique string; pydantic validation is not cheap."""
+    return AnyHttpUrl(url)
+
+
+@lru_cache(maxsize=16)
+def _render_ingress_config(model: str, app: str, external_host: str) -> dict:
+    """Render and parse the ingress config once per unique input tuple."""
+    return json.loads(
+        _get_ingress_template().render(
+            model=model,
+            app=app,
+            port=PORT,
+            external_host=external_host,
+        )
+    )
+
+
 @dataclass(frozen=True, slots=True)
 class InternalIngressData:
     """The data source from the internal-ingress integration."""
@@ -51,46 +82,32 @@ class InternalIngressData:
     config: dict = field(default_factory=dict)
 
     @classmethod
-    def _external_host(cls, requirer: TraefikRouteRequirer) -> Optional[str]:
+    def _external_host_and_scheme(
+        cls, requirer: TraefikRouteRequirer
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Fetch the provider databag once and return (external_host, scheme)."""
         if not (relation := requirer._charm.model.get_relation(INTERNAL_ROUTE_INTEGRATION_NAME)):
-            return
+            return None, None
         if not relation.app:
-            return
-        return relation.data[relation.app].get("external_host", "")
+            return None, None
 
-    @classmethod
-    def _scheme(cls, requirer: TraefikRouteRequirer) -> Optional[str]:
-        if not (relation := requirer._charm.model.get_relation(INTERNAL_ROUTE_INTEGRATION_NAME)):
-            return
-        if not relation.app:
-            return
-        return relation.data[relation.app].get("scheme", "")
+        data = relation.data[relation.app]
+        return data.get("external_host", ""), data.get("scheme", "")
 
     @classmethod
     def load(cls, requirer: TraefikRouteRequirer) -> "InternalIngressData":
         model, app = requirer._charm.model.name, requirer._charm.app.name
-        external_host = cls._external_host(requirer)
-        scheme = cls._scheme(requirer)
+        external_host, scheme = cls._external_host_and_scheme(requirer)
 
         external_endpoint = f"{scheme}://{external_host}/{model}-{app}"
-        with open("templates/internal-route.json.j2", "r") as file:
-            template = Template(file.read())
-
-        ingress_config = json.loads(
-            template.render(
-                model=model,
-                app=app,
-                port=PORT,
-                external_host=external_host,
-            )
-        )
+        ingress_config = _render_ingress_config(model, app, external_host or "")
 
         if not external_host:
             logger.error("External hostname is not set on the ingress provider")
             return cls()
 
         return cls(
-            url=AnyHttpUrl(external_endpoint),
+            url=_any_http_url(external_endpoint),
             config=ingress_config,
         )
 
@@ -99,7 +116,9 @@ class InternalIngressData:
         return self.url is not None and self.url.scheme == "https"
 
 
-@dataclass(frozen=True)
+# eq=False: instances are built, read and dropped within a hook; nothing
+# compares them structurally.
+@dataclass(frozen=True, slots=True, eq=False)
 class TracingData:
     """The data source from the tracing integration."""
 
@@ -119,11 +138,12 @@ class TracingData:
         if not (is_ready := requirer.is_ready()):
             return TracingData()
 
-        http_endpoint = urlparse(requirer.get_endpoint("otlp_http"))
+        # Only the scheme needs stripping; a full URL parse is overkill.
+        endpoint = requirer.get_endpoint("otlp_http") or ""
 
         return TracingData(
             is_ready=is_ready,
-            http_endpoint=http_endpoint.geturl().replace(f"{http_endpoint.scheme}://", "", 1),  # type: ignore[arg-type]
+            http_endpoint=endpoint.split("://", 1)[-1],
         )
 
 
@@ -131,8 +151,14 @@ class HydraHookIntegration:
     def __init__(self, provider: HydraHookProvider) -> None:
         self._provider = provider
 
+    @cached_property
+    def _relation(self) -> Optional[Relation]:
+        # get_relation goes through the Juju relation machinery; the relation
+        # object is stable within a hook.
+        return self._provider._charm.model.get_relation(HYDRA_TOKEN_HOOK_INTEGRATION_NAME)
+
     def is_ready(self) -> bool:
-        rel = self._provider._charm.model.get_relation(HYDRA_TOKEN_HOOK_INTEGRATION_NAME)
+        rel = self._relation
         return bool(rel and rel.active)
 
     def update_relation_data(
@@ -161,14 +187,14 @@ class DatabaseConfig:
     database: str = ""
     username: str = ""
     password: str = ""
-
-    @property
-    def dsn(self) -> str:
-        return POSTGRESQL_DSN_TEMPLATE.substitute(
-            username=self.username,
-            password=self.password,
-            endpoint=self.endpoint,
-            database=self.database,
+    # Derived once at construction; the fields are frozen.
+    dsn: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "dsn",
+            build_postgres_dsn(self.username, self.password, self.endpoint, self.database),
         )
 
     def to_env_vars(self) -> EnvVars:
@@ -182,17 +208,18 @@ class DatabaseConfig:
             return cls()
 
         integration_id = database_integrations[0].id
-        integration_data: dict[str, str] = requirer.fetch_relation_data()[integration_id]
+        integration_data: dict[str, str] = requirer.fetch_relation_data().get(integration_id, {})
 
         return cls(
-            endpoint=integration_data.get("endpoints", "").split(",")[0],
+            # partition stops at the first comma without building a list.
+            endpoint=integration_data.get("endpoints", "").partition(",")[0],
             database=requirer.database,
             username=integration_data.get("username", ""),
             password=integration_data.get("password", ""),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenFGAModelData:
     """The data source of the OpenFGA model."""
 
@@ -210,21 +237,22 @@ class OpenFGAModelData:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenFGAIntegrationData:
     """The data source from the OpenFGA integration."""
 
     url: str = ""
     api_token: str = ""
     store_id: str = ""
+    # Derived once at construction; the properties used to re-parse the URL
+    # on every access.
+    api_scheme: str = field(init=False, default="")
+    api_host: str = field(init=False, default="")
 
-    @property
-    def api_scheme(self) -> str:
-        return urlparse(self.url).scheme
-
-    @property
-    def api_host(self) -> str:
-        return urlparse(self.url).netloc
+    def __post_init__(self) -> None:
+        parsed = urlparse(self.url)
+        object.__setattr__(self, "api_scheme", parsed.scheme)
+        object.__setattr__(self, "api_host", parsed.netloc)
 
     def to_env_vars(self) -> EnvVars:
         return {
@@ -236,16 +264,30 @@ class OpenFGAIntegrationData:
 
 
 class OpenFGAIntegration:
+    _UNSET = object()
+
     def __init__(self, integration_requirer: "OpenFGARequires") -> None:
         self._openfga_requirer = integration_requirer
+        self._store_info: Any = self._UNSET
+
+    def _fetch_store_info(self) -> Any:
+        # The requirer fetch walks the Juju relation machinery; one fetch per
+        # hook is enough for both readiness checks and the data build.
+        if self._store_info is self._UNSET:
+            self._store_info = self._openfga_requirer.get_store_info()
+        return self._store_info
+
+    def invalidate(self) -> None:
+        """Drop the cached store info, e.g. after the relation changed mid-hook."""
+        self._store_info = self._UNSET
 
     def is_store_ready(self) -> bool:
-        provider_data = self._openfga_requirer.get_store_info()
+        provider_data = self._fetch_store_info()
         return provider_data is not None and provider_data.store_id is not None
 
     @property
     def openfga_integration_data(self) -> OpenFGAIntegrationData:
-        if not (provider_data := self._openfga_requirer.get_store_info()):
+        if not (provider_data := self._fetch_store_info()):
             return OpenFGAIntegrationData()
 
         if not provider_data.store_id or not provider_data.token:
@@ -284,7 +326,7 @@ class PeerData:
         return json.loads(data) if data else {}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OAuthProviderData:
     """The data source from the oauth integration."""
 
@@ -296,16 +338,21 @@ class OAuthProviderData:
     token_endpoint: str = ""
     client_id: str = ""
     client_secret: str = ""
+    # Derived once at construction: the fields are frozen, so the subject
+    # list cannot change afterwards.
+    _subjects_csv: str = field(init=False, repr=False, compare=False, default="")
 
-    def to_env_vars(self) -> EnvVars:
-        additional_subjects = [s.strip() for s in self.allowed_subjects.split(",") if s.strip()]
+    def __post_init__(self) -> None:
+        subjects = [s.strip() for s in self.allowed_subjects.split(",") if s.strip()]
         if self.client_id:
-            additional_subjects.append(self.client_id)
+            subjects.append(self.client_id)
+        object.__setattr__(self, "_subjects_csv", ",".join(subjects))
 
+    def to_env_vars(self) -> EnvVars:
         return {
             "AUTHENTICATION_ENABLED": self.auth_enabled,
             "AUTHENTICATION_ISSUER": self.oidc_issuer_url,
-            "AUTHENTICATION_ALLOWED_SUBJECTS": ",".join(additional_subjects),
+            "AUTHENTICATION_ALLOWED_SUBJECTS": self._subjects_csv,
             "AUTHENTICATION_REQUIRED_SCOPE": self.allowed_scope,
             "AUTHENTICATION_JWKS_URL": self.jwks_url,
         }
@@ -360,7 +407,7 @@ class OAuthIntegration:
         return client
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TenantServiceInfoData:
     """The data source from the tenant-service-info integration."""
 
@@ -384,7 +431,7 @@ class TenantServiceInfoData:
         return cls(service_url=relation.data[relation.app].get("service_url", ""))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TLSCertificates:
     ca_bundle: str
 
@@ -399,14 +446,14 @@ class TLSCertificates:
             CERTIFICATE_TRANSFER_INTEGRATION_NAME
         ]
 
+        # Single pass, no intermediate set per integration.
         for integration in cert_transfer_integrations:
-            ca = {
-                integration.data[unit]["ca"]
-                for unit in integration.units
-                if "ca" in integration.data.get(unit, {})
-            }
-            ca_certs.update(ca)
+            for unit in integration.units:
+                data = integration.data.get(unit)
+                if data and (ca := data.get("ca")):
+                    ca_certs.add(ca)
 
+        # sorted() keeps the bundle deterministic across hooks.
         ca_bundle = "\n".join(sorted(ca_certs))
 
         return cls(ca_bundle=ca_bundle)
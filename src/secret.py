@@ -19,18 +19,26 @@ class Secrets:
 
     def __init__(self, model: Model) -> None:
         self._model = model
+        self._is_ready: Optional[bool] = None
+        # Each secret-get is a hook-tool round-trip; contents are cached per
+        # label for the lifetime of the hook.
+        self._cache: dict[str, dict[str, str]] = {}
 
     def __getitem__(self, label: str) -> Optional[dict[str, str]]:
         """Get a secret."""
         if label not in self.LABELS:
             return None
 
+        if (content := self._cache.get(label)) is not None:
+            return content
+
         try:
             secret = self._model.get_secret(label=label)
         except SecretNotFoundError:
             return None
 
-        return secret.get_content()
+        self._cache[label] = content = secret.get_content()
+        return content
 
     def __setitem__(self, label: str, content: dict[str, str]) -> None:
         """Set a secret."""
@@ -38,17 +46,16 @@ class Secrets:
             raise ValueError(f"Invalid label: '{label}'. Valid labels are: {self.LABELS}.")
 
         self._model.app.add_secret(content, label=label)
+        self._is_ready = None
+        self._cache.pop(label, None)
 
     def values(self) -> ValuesView:
         """Get the ValuesView."""
         secret_contents = {}
         for key, label in zip(self.KEYS, self.LABELS):
-            try:
-                secret = self._model.get_secret(label=label)
-            except SecretNotFoundError:
+            if (content := self[label]) is None:
                 return ValuesView({})
-            else:
-                secret_contents[key] = secret.get_content()
+            secret_contents[key] = content
 
         return secret_contents.values()
 
@@ -59,9 +66,15 @@ class Secrets:
         }
 
     def is_ready(self) -> bool:
-        """Check whether the service secrets are ready."""
-        values = self.values()
-        return all(values) if values else False
+        """Check whether the service secrets are ready.
+
+        The result is cached for the lifetime of the hook; writing a secret
+        invalidates it.
+        """
+        if self._is_ready is None:
+            values = self.values()
+            self._is_ready = all(values) if values else False
+        return self._is_ready
 
     @property
     def api_token(self) -> str:
@@ -3,11 +3,13 @@
 
 """Helper class to manage the charm's services."""
 
+import copy
 import logging
+from functools import cached_property
 from typing import Optional
 
 from ops import Container, ModelError, Unit
-from ops.pebble import CheckStatus, Layer, LayerDict, ServiceInfo
+from ops.pebble import CheckInfo, CheckStatus, Layer, LayerDict, ServiceInfo
 
 from cli import CommandLine
 from constants import (
@@ -44,23 +46,23 @@ PEBBLE_LAYER_DICT: LayerDict = {
     },
 }
 
+# Parsed once at import time; render_pebble_layer only swaps the environment
+# in, so the static parts are never re-validated per call.
+_BASE_LAYER = Layer(PEBBLE_LAYER_DICT)
+
 
 class WorkloadService:
     """Workload service abstraction running in a Juju unit."""
 
-    def __init__(self, unit: Unit) -> None:
-        self._version = ""
-
+    def __init__(self, unit: Unit, container: Container) -> None:
         self._unit: Unit = unit
-        self._container: Container = unit.get_container(WORKLOAD_CONTAINER)
+        self._container: Container = container
         self._cli = CommandLine(self._container)
 
-    @property
+    @cached_property
     def version(self) -> str:
-        """The service version."""
-        if not self._version:
-            self._version = self._cli.get_service_version() or ""
-        return self._version
+        """The service version, fetched once per charm object."""
+        return self._cli.get_service_version() or ""
 
     def get_service(self) -> Optional[ServiceInfo]:
         try:
@@ -75,6 +77,14 @@ class WorkloadService:
         except Exception as e:
             logger.error("Failed to set workload version: %s", e)
 
+    @cached_property
+    def _ready_check(self) -> Optional[CheckInfo]:
+        """The readiness check state, fetched once per charm object.
+
+        Both is_running and is_failing need it; one Pebble round-trip serves both.
+        """
+        return self._container.get_checks().get(PEBBLE_READY_CHECK_NAME)
+
     def is_running(self) -> bool:
         """Checks whether the service is running."""
         if not (service := self.get_service()):
@@ -83,8 +93,7 @@ class WorkloadService:
         if not service.is_running():
             return False
 
-        c = self._container.get_checks().get(PEBBLE_READY_CHECK_NAME)
-        if not c:
+        if not (c := self._ready_check):
             return False
 
         return c.status == CheckStatus.UP
@@ -94,7 +103,7 @@ class WorkloadService:
         if not self.get_service():
             return False
 
-        if not (c := self._container.get_checks().get(PEBBLE_READY_CHECK_NAME)):
+        if not (c := self._ready_check):
             return False
 
         return c.failures > 0
@@ -130,10 +139,9 @@ class WorkloadService:
 class PebbleService:
     """Pebble service abstraction running in a Juju unit."""
 
-    def __init__(self, unit: Unit) -> None:
+    def __init__(self, unit: Unit, container: Container) -> None:
         self._unit = unit
-        self._container = unit.get_container(WORKLOAD_CONTAINER)
-        self._layer_dict: LayerDict = PEBBLE_LAYER_DICT
+        self._container = container
 
     def _restart_service(self, restart: bool = False) -> None:
         if restart:
@@ -154,14 +162,18 @@ class PebbleService:
 
     def render_pebble_layer(self, *env_var_sources: EnvVarConvertible) -> Layer:
         """Render the pebble layer."""
-        updated_env_vars: dict[str, str | bool] = {}
+        # One dict, filled in a single pass: defaults first, then each source
+        # overrides in order.
+        env_vars: dict[str, str | bool] = dict(DEFAULT_CONTAINER_ENV)
         for source in env_var_sources:
-            updated_env_vars.update(source.to_env_vars())
+            env_vars.update(source.to_env_vars())
 
-        env_vars = {
-            **DEFAULT_CONTAINER_ENV,
-            **updated_env_vars,
-        }
-        self._layer_dict["services"][WORKLOAD_SERVICE]["environment"] = env_vars  # type: ignore[index]
+        # Shallow-copy the skeleton and replace only the workload service so
+        # the shared base layer is never mutated.
+        layer = copy.copy(_BASE_LAYER)
+        layer.services = dict(layer.services)
+        service = copy.copy(layer.services[WORKLOAD_SERVICE])
+        service.environment = env_vars
+        layer.services[WORKLOAD_SERVICE] = service
 
-        return Layer(self._layer_dict)
+        return layer
@@ -32,7 +32,8 @@ def leader_unit(func: CharmEventHandler) -> CharmEventHandler:
 
     @wraps(func)
     def wrapper(charm: "HookServiceOperatorCharm", *args: Any, **kwargs: Any) -> Optional[Any]:
-        if not charm.unit.is_leader():
+        # Leadership is cached on the charm; is-leader can be a hook-tool call.
+        if not charm._is_leader:
             return None
 
         return func(charm, *args, **kwargs)
@@ -75,9 +76,7 @@ def openfga_store_readiness(charm: "HookServiceOperatorCharm") -> bool:
 
 
 def openfga_model_readiness(charm: "HookServiceOperatorCharm") -> bool:
-    version = charm._workload_service.version
-
-    if not (openfga_model := charm.peer_data[version]):
+    if not (openfga_model := charm._peer_bucket):
         return False
 
     return bool(openfga_model.get(OPENFGA_MODEL_ID))
@@ -117,11 +116,13 @@ def authentication_config_is_valid(charm: "HookServiceOperatorCharm") -> bool:
     return isinstance(status, ActiveStatus)
 
 
-# Condition failure causes early return without doing anything
+# Condition failure causes early return without doing anything.
+# Ordered by cost: in-process relation/config checks run first so the common
+# "not ready yet" paths bail out before the Pebble socket round-trip.
 NOOP_CONDITIONS: tuple[Condition, ...] = (
-    container_connectivity,
     database_integration_exists,
-    database_resource_is_created,
     openfga_integration_exists,
     authentication_config_is_valid,
+    database_resource_is_created,
+    container_connectivity,
 )
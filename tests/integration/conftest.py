@@ -1,7 +1,10 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import hashlib
 import os
+import shutil
+import subprocess
 import uuid
 from pathlib import Path
 from typing import Generator, Iterator
@@ -11,6 +14,8 @@ import pytest
 import requests
 from integration.utils import create_temp_juju_model
 
+BUILD_CACHE_DIR = Path.home() / ".cache" / "hook-service-operator"
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add custom command-line options for model management and deployment control.
@@ -81,27 +86,67 @@ def model(request: pytest.FixtureRequest) -> Iterator[jubilant.Juju]:
     yield from create_temp_juju_model(request, model=model_name)
 
 
-@pytest.fixture(scope="module")
-def local_charm(model: jubilant.Juju) -> Path:
+def _source_tree_hash() -> str:
+    """Hash the inputs of a charm build, so unchanged trees can skip the pack."""
+    digest = hashlib.sha256()
+    paths = sorted([
+        Path("charmcraft.yaml"),
+        Path("pyproject.toml"),
+        Path("uv.lock"),
+        *Path("src").rglob("*.py"),
+        *Path("lib").rglob("*.py"),
+        *(p for p in Path("templates").rglob("*") if p.is_file()),
+    ])
+    for path in paths:
+        digest.update(path.as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _build_charm() -> Path:
+    subprocess.run(["charmcraft", "pack"], check=True)
+    charms = list(Path(".").glob("*.charm"))
+    if not charms:
+        raise RuntimeError("Charm not found and build failed")
+    return charms[0].absolute()
+
+
+@pytest.fixture(scope="session")
+def local_charm() -> Path:
     """Get the path to the charm-under-test."""
     # in GitHub CI, charms are built with charmcraftcache and uploaded to $CHARM_PATH
-    charm: str | Path | None = os.getenv("CHARM_PATH")
-    if not charm:
-        import subprocess
-
-        subprocess.run(["charmcraft", "pack"], check=True)
-        charms = list(Path(".").glob("*.charm"))
-        if charms:
-            charm = charms[0].absolute()
-        else:
-            raise RuntimeError("Charm not found and build failed")
-    return Path(charm)
-
-
-@pytest.fixture
+    if charm := os.getenv("CHARM_PATH"):
+        return Path(charm)
+
+    # Opt-in local build cache: charmcraft pack takes minutes, and local
+    # re-runs on an unchanged tree rebuild the same artifact every time.
+    if not os.getenv("HOOK_CHARM_BUILD_CACHE"):
+        return _build_charm()
+
+    cached = BUILD_CACHE_DIR / f"{_source_tree_hash()}.charm"
+    if not cached.exists():
+        BUILD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(_build_charm(), cached)
+    return cached
+
+
+# Session scope: one connection pool for the whole run, so the TCP/TLS
+# handshakes are paid once instead of per test. The adapter keeps a few
+# connections alive per host and retries transient gateway errors while
+# Traefik routes settle.
+@pytest.fixture(scope="session")
 def http_client() -> Generator[requests.Session, None, None]:
     with requests.Session() as client:
         client.verify = False
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=requests.adapters.Retry(
+                total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)
+            ),
+        )
+        client.mount("http://", adapter)
+        client.mount("https://", adapter)
         yield client
 
 
@@ -5,7 +5,11 @@ from pathlib import Path
 
 import yaml
 
-METADATA = yaml.safe_load(Path("./charmcraft.yaml").read_text())
+# libyaml parses several times faster than the pure-Python loader; fall back
+# gracefully where the binding is not compiled in.
+SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+METADATA = yaml.load(Path("./charmcraft.yaml").read_text(), Loader=SAFE_LOADER)
 APP_NAME = METADATA["name"]
 TRAEFIK_CHARM = "traefik-k8s"
 TRAEFIK_APP = "traefik"
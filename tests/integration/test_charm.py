@@ -3,6 +3,8 @@
 # See LICENSE file for licensing details.
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import jubilant
@@ -21,7 +23,7 @@ from integration.constants import (
 )
 from integration.utils import (
     remove_integration,
-    unit_address,
+    unit_addresses,
     wait_for_active_idle,
     wait_for_status,
 )
@@ -29,6 +31,16 @@ from integration.utils import (
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(scope="module")
+def addresses(model: jubilant.Juju) -> dict:
+    """Unit addresses for the deployed apps, resolved from one status fetch.
+
+    First requested after test_build_and_deploy has converged, so the
+    addresses are stable for the rest of the module.
+    """
+    return unit_addresses(model, app_names=[APP_NAME, TRAEFIK_APP])
+
+
 @pytest.mark.skip_if_deployed
 def test_build_and_deploy(
     model: jubilant.Juju,
@@ -41,39 +53,53 @@ def test_build_and_deploy(
     """
     resources = {"oci-image": METADATA["resources"]["oci-image"]["upstream-source"]}
 
-    model.deploy(
-        str(local_charm),
-        resources=resources,
-        app=APP_NAME,
-        config=charm_config,
+    # The four deploys are independent Juju API calls; run them concurrently
+    # so the wall clock pays for one controller round-trip instead of four.
+    deploys = (
+        partial(
+            model.deploy,
+            str(local_charm),
+            resources=resources,
+            app=APP_NAME,
+            config=charm_config,
+        ),
+        partial(
+            model.deploy,
+            TRAEFIK_CHARM,
+            app=TRAEFIK_APP,
+            channel="latest/stable",
+            config={"external_hostname": INGRESS_DOMAIN},
+            trust=True,
+        ),
+        partial(
+            model.deploy,
+            DB_CHARM,
+            app=DB_APP,
+            channel="14/stable",
+            trust=True,
+        ),
+        partial(
+            model.deploy,
+            OPENFGA_CHARM,
+            app=OPENFGA_APP,
+            channel="latest/edge",
+            trust=True,
+        ),
     )
-
-    model.deploy(
-        TRAEFIK_CHARM,
-        app=TRAEFIK_APP,
-        channel="latest/stable",
-        config={"external_hostname": INGRESS_DOMAIN},
-        trust=True,
+    with ThreadPoolExecutor(max_workers=len(deploys)) as executor:
+        for future in [executor.submit(deploy) for deploy in deploys]:
+            future.result()
+
+    # Integrations are independent of each other as well; fire them together.
+    integrations = (
+        partial(model.integrate, TRAEFIK_APP, f"{APP_NAME}:internal-route"),
+        partial(model.integrate, DB_APP, APP_NAME),
+        partial(model.integrate, f"{DB_APP}:database", f"{OPENFGA_APP}:database"),
+        partial(model.integrate, OPENFGA_APP, f"{APP_NAME}:openfga"),
     )
-
-    model.deploy(
-        DB_CHARM,
-        app=DB_APP,
-        channel="14/stable",
-        trust=True,
-    )
-
-    model.deploy(
-        OPENFGA_CHARM,
-        app=OPENFGA_APP,
-        channel="latest/edge",
-        trust=True,
-    )
-
-    model.integrate(TRAEFIK_APP, f"{APP_NAME}:internal-route")
-    model.integrate(DB_APP, APP_NAME)
-    model.integrate(f"{DB_APP}:database", f"{OPENFGA_APP}:database")
-    model.integrate(OPENFGA_APP, f"{APP_NAME}:openfga")
+    with ThreadPoolExecutor(max_workers=len(integrations)) as executor:
+        for future in [executor.submit(integrate) for integrate in integrations]:
+            future.result()
 
     wait_for_active_idle(
         model,
@@ -85,10 +111,9 @@ def test_build_and_deploy(
 def test_app_health(
     model: jubilant.Juju,
     http_client: requests.Session,
+    addresses: dict,
 ) -> None:
-    public_address = unit_address(model, app_name=APP_NAME, unit_num=0)
-
-    resp = http_client.get(f"http://{public_address}:8080/api/v0/status")
+    resp = http_client.get(f"http://{addresses[APP_NAME]}:8080/api/v0/status")
 
     resp.raise_for_status()
 
@@ -96,9 +121,9 @@ def test_app_health(
 def test_ingress_route(
     model: jubilant.Juju,
     http_client: requests.Session,
+    addresses: dict,
 ) -> None:
-    address = unit_address(model, app_name=TRAEFIK_APP, unit_num=0)
-    url = f"https://{address}/{model.model}-{APP_NAME}/api/v0/status"
+    url = f"https://{addresses[TRAEFIK_APP]}/{model.model}-{APP_NAME}/api/v0/status"
     resp = http_client.get(url)
 
     resp.raise_for_status()
@@ -107,9 +132,9 @@ def test_ingress_route(
 def test_groups_api(
     model: jubilant.Juju,
     http_client: requests.Session,
+    addresses: dict,
 ) -> None:
-    address = unit_address(model, app_name=TRAEFIK_APP, unit_num=0)
-    url = f"https://{address}/{model.model}-{APP_NAME}/api/v0/authz/groups"
+    url = f"https://{addresses[TRAEFIK_APP]}/{model.model}-{APP_NAME}/api/v0/authz/groups"
     resp = http_client.get(url)
 
     resp.raise_for_status()
@@ -24,8 +24,11 @@ from integration.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Every test here is disabled; one module-level mark keeps pytest from
+# evaluating per-function skip decorators on each collection.
+pytestmark = pytest.mark.skip(reason="upgrade path disabled")
+
 
-@pytest.mark.skip
 @pytest.mark.skip_if_deployed
 def test_deploy_stable(
     model: jubilant.Juju,
@@ -63,7 +66,6 @@ def test_deploy_stable(
     wait_for_active_idle(model, [APP_NAME, TRAEFIK_APP, DB_APP])
 
 
-@pytest.mark.skip
 def test_upgrade(
     model: jubilant.Juju,
     local_charm: Path | str,
@@ -80,7 +82,6 @@ def test_upgrade(
     wait_for_active_idle(model, [APP_NAME, TRAEFIK_APP, DB_APP])
 
 
-@pytest.mark.skip
 def test_post_upgrade_check(model: jubilant.Juju, http_client: requests.Session) -> None:
     """Verify functionality after upgrade."""
     address = unit_address(model, app_name=APP_NAME, unit_num=0)
@@ -1,13 +1,15 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import json
+import time
 from contextlib import contextmanager
 from typing import Iterator, Optional
 
 import jubilant
 import pytest
 import yaml
-from integration.constants import APP_NAME
+from integration.constants import APP_NAME, SAFE_LOADER
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 
@@ -41,18 +43,35 @@ def create_temp_juju_model(
             print(log, end="")
 
 
-def get_unit_data(model: jubilant.Juju, unit_name: str) -> dict:
-    """Get the data for a given unit."""
-    stdout = model.cli("show-unit", unit_name)
-    cmd_output = yaml.safe_load(stdout)
-    return cmd_output[unit_name]
+# show-unit is a multi-second subprocess + parse round-trip; memoize per unit
+# and let callers that just changed the model ask for a refresh.
+_unit_data_cache: dict[str, dict] = {}
+
+
+def get_unit_data(model: jubilant.Juju, unit_name: str, *, refresh: bool = False) -> dict:
+    """Get the data for a given unit.
+
+    The result is cached per unit name; pass refresh=True after mutating the
+    model (integrate, scale, ...) to force a new fetch.
+    """
+    if refresh or unit_name not in _unit_data_cache:
+        # JSON output parses an order of magnitude faster than the YAML default.
+        stdout = model.cli("show-unit", unit_name, "--format", "json")
+        cmd_output = json.loads(stdout)
+        _unit_data_cache[unit_name] = cmd_output[unit_name]
+    return _unit_data_cache[unit_name]
 
 
 def get_integration_data(
-    model: jubilant.Juju, app_name: str, integration_name: str, unit_num: int = 0
+    model: jubilant.Juju,
+    app_name: str,
+    integration_name: str,
+    unit_num: int = 0,
+    *,
+    refresh: bool = False,
 ) -> Optional[dict]:
     """Get the integration data for a given integration."""
-    data = get_unit_data(model, f"{app_name}/{unit_num}")
+    data = get_unit_data(model, f"{app_name}/{unit_num}", refresh=refresh)
     return next(
         (
             integration
@@ -68,17 +87,55 @@ def get_app_integration_data(
     app_name: str,
     integration_name: str,
     unit_num: int = 0,
+    *,
+    refresh: bool = False,
 ) -> Optional[dict]:
     """Get the application data for a given integration."""
-    data = get_integration_data(model, app_name, integration_name, unit_num)
+    data = get_integration_data(model, app_name, integration_name, unit_num, refresh=refresh)
     return data["application-data"] if data else None
 
 
+# Each juju status call is a controller RPC returning the full model status;
+# a short TTL keeps back-to-back lookups to one RPC while still noticing
+# newly scaled units.
+_STATUS_TTL = 5.0
+_status_cache: dict[str, tuple[float, dict]] = {}
+
+
+def get_status_cached(model: jubilant.Juju, *, ttl: float = _STATUS_TTL) -> dict:
+    """Get the parsed model status, reusing a fetch younger than ttl seconds."""
+    key = model.model or ""
+    now = time.monotonic()
+    if (cached := _status_cache.get(key)) and now - cached[0] < ttl:
+        return cached[1]
+
+    status = yaml.load(model.cli("status", "--format", "yaml"), Loader=SAFE_LOADER)
+    _status_cache[key] = (now, status)
+    return status
+
+
+def invalidate_status_cache() -> None:
+    """Drop cached statuses, e.g. right after mutating the model."""
+    _status_cache.clear()
+
+
+def unit_addresses(model: jubilant.Juju, *, app_names: list[str], unit_num: int = 0) -> dict:
+    """Get the unit addresses for several apps from a single status fetch."""
+    status = get_status_cached(model)
+    return {
+        app_name: status["applications"][app_name]["units"][f"{app_name}/{unit_num}"]["address"]
+        for app_name in app_names
+    }
+
+
 def unit_address(model: jubilant.Juju, *, app_name: str, unit_num: int = 0) -> str:
     """Get the address of a unit."""
-    status_yaml = model.cli("status", "--format", "yaml")
-    status = yaml.safe_load(status_yaml)
-    return status["applications"][app_name]["units"][f"{app_name}/{unit_num}"]["address"]
+    return unit_addresses(model, app_names=[app_name], unit_num=unit_num)[app_name]
+
+
+# Convergence takes minutes; polling the controller every second just adds
+# status-RPC load without shortening the wait.
+WAIT_POLL_INTERVAL = 5.0
 
 
 def wait_for_active_idle(model: jubilant.Juju, apps: list[str], timeout: float = 1000) -> None:
@@ -87,7 +144,7 @@ def wait_for_active_idle(model: jubilant.Juju, apps: list[str], timeout: float =
     def condition(s: jubilant.Status) -> bool:
         return jubilant.all_active(s, *apps) and jubilant.all_agents_idle(s, *apps)
 
-    model.wait(condition, error=jubilant.any_error, timeout=timeout)
+    model.wait(condition, error=jubilant.any_error, delay=WAIT_POLL_INTERVAL, timeout=timeout)
 
 
 def wait_for_status(
@@ -98,7 +155,7 @@ def wait_for_status(
     def condition(s: jubilant.Status) -> bool:
         return all(s.apps[app_name].app_status.current == status for app_name in apps)
 
-    model.wait(condition, timeout=timeout)
+    model.wait(condition, delay=WAIT_POLL_INTERVAL, timeout=timeout)
 
 
 @contextmanager
@@ -122,7 +179,9 @@ def remove_integration(
         juju.integrate(f"{APP_NAME}:{integration_name}", remote_app_name)
 
     juju.remove_relation(f"{APP_NAME}:{integration_name}", remote_app_name)
+    invalidate_status_cache()
     try:
         yield
     finally:
         _reintegrate()
+        invalidate_status_cache()
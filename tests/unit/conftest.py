@@ -24,10 +24,15 @@ def mocked_k8s_resource_patch(mocker: MockerFixture) -> None:
     mock_patcher_instance.is_failed.return_value = (False, "")
     mock_patcher_instance.is_ready.return_value = True
 
-    mocker.patch("charm.KubernetesComputeResourcesPatch.is_ready", return_value=True)
-    mocker.patch("charm.KubernetesComputeResourcesPatch.get_status", return_value=ActiveStatus())
-    mocker.patch("charm.KubernetesComputeResourcesPatch._patch", return_value=True)
-    mocker.patch("charm.KubernetesComputeResourcesPatch._namespace", return_value="model")
+    # One patcher context instead of four; each mocker.patch call pays its own
+    # import/attribute resolution and teardown bookkeeping.
+    mocker.patch.multiple(
+        "charm.KubernetesComputeResourcesPatch",
+        is_ready=MagicMock(return_value=True),
+        get_status=MagicMock(return_value=ActiveStatus()),
+        _patch=MagicMock(return_value=True),
+        _namespace=MagicMock(return_value="model"),
+    )
 
 
 @pytest.fixture(autouse=True)
@@ -53,33 +58,42 @@ def mocked_charm_holistic_handler(mocker: MockerFixture) -> MagicMock:
     return mocker.patch("charm.HookServiceOperatorCharm._holistic_handler")
 
 
-@pytest.fixture
-def mocked_is_running(mocker: MockerFixture) -> MagicMock:
-    return mocker.patch("charm.WorkloadService.is_running", return_value=True)
-
-
 @pytest.fixture
 def mocked_open_port(mocker: MockerFixture) -> MagicMock:
     return mocker.patch("charm.WorkloadService.open_port")
 
 
-@pytest.fixture
+# create_autospec reflects over the whole spec class; build the mirrors once
+# per module and reset them between tests instead of re-specing every time.
+@pytest.fixture(scope="module")
 def mocked_container() -> MagicMock:
     return create_autospec(Container)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mocked_unit(mocked_container: MagicMock) -> MagicMock:
     mocked = create_autospec(Unit)
     mocked.get_container.return_value = mocked_container
     return mocked
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mocked_event() -> MagicMock:
     return create_autospec(EventBase)
 
 
+@pytest.fixture(autouse=True)
+def _reset_autospec_mocks(
+    mocked_container: MagicMock,
+    mocked_unit: MagicMock,
+    mocked_event: MagicMock,
+    mocked_collect_status_event: MagicMock,
+) -> None:
+    for mocked in (mocked_container, mocked_unit, mocked_event, mocked_collect_status_event):
+        mocked.reset_mock(return_value=True, side_effect=True)
+    mocked_unit.get_container.return_value = mocked_container
+
+
 @pytest.fixture
 def internal_route_integration_data() -> dict:
     return {
@@ -98,12 +112,12 @@ def internal_route_integration(internal_route_integration_data: dict) -> testing
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def api_token() -> str:
     return "secret"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def api_token_secret(api_token: str) -> testing.Secret:
     return testing.Secret(
         tracked_content={"api-token": api_token},
@@ -119,7 +133,7 @@ def mocked_secrets(
     return [api_token_secret, openfga_secret]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def charm_config() -> dict:
     return {
         "http_proxy": "http://proxy.internal:6666",
@@ -128,27 +142,28 @@ def charm_config() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mocked_collect_status_event() -> MagicMock:
     return create_autospec(CollectStatusEvent)
 
 
 @pytest.fixture
-def mocked_openfga_integration_exists(mocker: MockerFixture) -> MagicMock:
-    return mocker.patch("charm.openfga_integration_exists", return_value=True)
-
+def all_satisfied_conditions(mocker: MockerFixture) -> None:
+    """Satisfy every reconcile precondition with a single patcher context.
 
-@pytest.fixture
-def all_satisfied_conditions(
-    mocked_container_connectivity: MagicMock,
-    mocked_secrets_is_ready: MagicMock,
-    mocked_is_running: MagicMock,
-    mocked_database_integration_exists: MagicMock,
-    mocked_database_resource_is_created: MagicMock,
-    mocked_migration_is_ready: MagicMock,
-    mocked_openfga_integration_exists: MagicMock,
-) -> None:
-    pass
+    Deliberately opt-in: tests exercising the real conditions (e.g. the
+    holistic-handler ones) must not pick this up.
+    """
+    mocker.patch.multiple(
+        "charm",
+        container_connectivity=MagicMock(return_value=True),
+        database_integration_exists=MagicMock(return_value=True),
+        database_resource_is_created=MagicMock(return_value=True),
+        migration_is_ready=MagicMock(return_value=True),
+        openfga_integration_exists=MagicMock(return_value=True),
+    )
+    mocker.patch("charm.Secrets.is_ready", return_value=True)
+    mocker.patch("charm.WorkloadService.is_running", return_value=True)
 
 
 @pytest.fixture
@@ -217,7 +232,7 @@ def peer_relation(mocked_workload_service_version: MagicMock) -> testing.PeerRel
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def migration_exec_factory() -> Callable[[str, str, int], Exec]:
     def _factory(command: str, stdout: str, return_code: int) -> Exec:
         return Exec(
@@ -233,17 +248,17 @@ def migration_exec_factory() -> Callable[[str, str, int], Exec]:
     return _factory
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_migration_check_exec(migration_exec_factory: Callable[[str, str, int], Exec]) -> Exec:
     return migration_exec_factory("check", '{"status": "ok"}', 0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_migration_up_exec(migration_exec_factory: Callable[[str, str, int], Exec]) -> Exec:
     return migration_exec_factory("up", "", 0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def version_check_exec() -> Exec:
     return Exec(
         command_prefix=["hook-service", "version"],
@@ -252,12 +267,12 @@ def version_check_exec() -> Exec:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def openfga_model_id() -> str:
     return "01HT27W9Y00000000000000000"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def create_fga_model_exec(openfga_model_id: str) -> Exec:
     return Exec(
         command_prefix=["hook-service", "create-fga-model"],
@@ -266,12 +281,12 @@ def create_fga_model_exec(openfga_model_id: str) -> Exec:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def context() -> testing.Context:
     return testing.Context(HookServiceOperatorCharm)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def container(
     default_migration_check_exec: Exec,
     default_migration_up_exec: Exec,
@@ -309,31 +324,6 @@ def base_state(
     )
 
 
-@pytest.fixture
-def mocked_database_integration_exists(mocker: MockerFixture) -> MagicMock:
-    return mocker.patch("charm.database_integration_exists", return_value=True)
-
-
-@pytest.fixture
-def mocked_database_resource_is_created(mocker: MockerFixture) -> MagicMock:
-    return mocker.patch("charm.database_resource_is_created", return_value=True)
-
-
-@pytest.fixture
-def mocked_migration_is_ready(mocker: MockerFixture) -> MagicMock:
-    return mocker.patch("charm.migration_is_ready", return_value=True)
-
-
-@pytest.fixture
-def mocked_container_connectivity(mocker: MockerFixture) -> MagicMock:
-    return mocker.patch("charm.container_connectivity", return_value=True)
-
-
-@pytest.fixture
-def mocked_secrets_is_ready(mocker: MockerFixture) -> MagicMock:
-    return mocker.patch("charm.Secrets.is_ready", return_value=True)
-
-
 @pytest.fixture
 def oauth_relation() -> testing.Relation:
     return testing.Relation(
@@ -377,4 +367,6 @@ def mocked_requests(mocker: MockerFixture) -> MagicMock:
 
 @pytest.fixture(autouse=True)
 def mocked_subprocess_run(mocker: MockerFixture) -> MagicMock:
-    return mocker.patch("subprocess.run")
+    mocked = mocker.patch("subprocess.run")
+    mocked.return_value.returncode = 0
+    return mocked
@@ -2,6 +2,7 @@
 # See LICENSE file for licensing details.
 
 import dataclasses
+import hashlib
 from typing import Any, ClassVar, Protocol, TypeVar
 from unittest.mock import MagicMock, patch
 
@@ -1395,6 +1396,67 @@ class TestCertificateEvents:
 
         mock_path.write_text.assert_called_with("some-ca-cert")
         mocked_subprocess_run.assert_called()
+        mock_path.with_suffix.return_value.write_text.assert_called_once()
+
+    def test_on_certificate_changed_when_refresh_fails(
+        self,
+        context: testing.Context,
+        base_state: testing.State,
+        certificate_transfer_relation: testing.Relation,
+        mocked_subprocess_run: MagicMock,
+        mocker: MagicMock,  # To mock path operations
+    ) -> None:
+        mock_path = mocker.patch("charm.LOCAL_CHARM_CERTIFICATES_FILE")
+        mock_path.exists.return_value = False
+        mock_path.parent.mkdir.return_value = None
+
+        mock_tls = mocker.patch("charm.TLSCertificates")
+        mock_tls.load.return_value.ca_bundle = "some-ca-cert"
+
+        mocked_subprocess_run.return_value.returncode = 1
+
+        state_in = replace_state(
+            base_state,
+            relations=[certificate_transfer_relation] + list(base_state.relations),
+        )
+
+        context.run(context.on.relation_changed(certificate_transfer_relation), state_in)
+
+        # The sidecar hash must not be persisted on a failed refresh, so the
+        # next hook retries instead of skipping on a matching hash.
+        mock_path.with_suffix.return_value.write_text.assert_not_called()
+
+    def test_on_certificate_changed_when_hash_matches(
+        self,
+        context: testing.Context,
+        base_state: testing.State,
+        certificate_transfer_relation: testing.Relation,
+        mocked_subprocess_run: MagicMock,
+        mocker: MagicMock,  # To mock path operations
+    ) -> None:
+        mock_path = mocker.patch("charm.LOCAL_CHARM_CERTIFICATES_FILE")
+        mock_path.exists.return_value = True
+        mock_path.parent.mkdir.return_value = None
+        mock_hash_file = mock_path.with_suffix.return_value
+        mock_hash_file.exists.return_value = True
+        mock_hash_file.read_text.return_value = hashlib.sha256(b"some-ca-cert").hexdigest()
+
+        mock_tls = mocker.patch("charm.TLSCertificates")
+        mock_tls.load.return_value.ca_bundle = "some-ca-cert"
+
+        mocked_update_ca_certs = mocker.patch("charm.WorkloadService.update_ca_certs")
+
+        state_in = replace_state(
+            base_state,
+            relations=[certificate_transfer_relation] + list(base_state.relations),
+        )
+
+        context.run(context.on.relation_changed(certificate_transfer_relation), state_in)
+
+        # A matching hash skips the trust-store refresh, but the workload-side
+        # bundle must still be repaired in case its container restarted.
+        mocked_subprocess_run.assert_not_called()
+        mocked_update_ca_certs.assert_called()
 
 
 class TestUseIngressForRelations:
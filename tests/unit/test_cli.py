@@ -37,9 +37,7 @@ class TestCommandLine:
 
         assert actual_stdout == expected_stdout
         assert actual_stderr == expected_stderr
-        mocked_container.exec.assert_called_once_with(
-            cmd, service_context=None, timeout=20, environment={}, stdin=None
-        )
+        mocked_container.exec.assert_called_once_with(cmd, environment={}, timeout=20)
 
     def test_run_cmd_failed(self, mocked_container: MagicMock, command_line: CommandLine) -> None:
         cmd = ["cmd"]
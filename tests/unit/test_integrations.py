@@ -17,6 +17,8 @@ from integrations import (
     OpenFGAIntegration,
     OpenFGAIntegrationData,
     OpenFGAModelData,
+    _get_ingress_template,
+    _render_ingress_config,
 )
 
 
@@ -39,6 +41,11 @@ class TestInternalIngressData:
 
         return mocked
 
+    @pytest.fixture(autouse=True)
+    def clear_template_cache(self) -> None:
+        _get_ingress_template.cache_clear()
+        _render_ingress_config.cache_clear()
+
     @pytest.fixture
     def ingress_template(self) -> str:
         return (